@@ -20,7 +20,7 @@ import importlib
 from collections import namedtuple
 from csv import reader, writer
 from enum import Enum
-from io import TextIOBase
+from io import StringIO, TextIOBase
 
 try:
     from importlib.resources import files
@@ -40,9 +40,20 @@ except ImportError:
 
 # third-party
 from pyomo.contrib.viewer.report import degrees_of_freedom
-from pydantic import BaseModel, Field, field_validator, ValidationInfo, ConfigDict
+from pydantic import (
+    BaseModel,
+    Field,
+    field_validator,
+    ValidationInfo,
+    ConfigDict,
+    PrivateAttr,
+    TypeAdapter,
+)
 import pyomo.environ as pyo
 
+# pydantic requires the typing_extensions version of TypedDict for Python < 3.12
+from typing_extensions import TypedDict
+
 #: Forward-reference to a FlowsheetInterface type, used in
 #: :meth:`FlowsheetInterface.find`
 FSI = TypeVar("FSI", bound="FlowsheetInterface")
@@ -102,7 +113,12 @@ class ModelExport(BaseModel):
     num_samples: int = 2
     has_bounds: bool = True
     is_sweep: bool = False
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # write NaN/Infinity in JSON, like the json module, instead of null
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, ser_json_inf_nan="constants"
+    )
+    # (obj, units) of the last lookup done by obj_units
+    _obj_units: Optional[tuple] = PrivateAttr(default=None)
 
     @field_validator("obj")
     @classmethod
@@ -191,6 +207,42 @@ class ModelExport(BaseModel):
             v = str(obj)
         return v
 
+    @property
+    def obj_units(self):
+        """Units of the exported object.
+
+        The lookup is cached, since the units of a constructed Pyomo object
+        do not change, and repeated if ``obj`` is not the object it was done for.
+        """
+        cached = self._obj_units
+        if cached is None or cached[0] is not self.obj:
+            cached = self._obj_units = (self.obj, pyo.units.get_units(self.obj))
+        return cached[1]
+
+
+class ExportValues(TypedDict, total=False):
+    """Values of one serialized :class:`ModelExport` that are copied back into
+    the model by :meth:`FlowsheetInterface.load`.
+
+    This is a plain dict, so loading does not need to re-run the
+    :class:`ModelExport` validators (which require a Pyomo object) for each export.
+    Keys that are missing are left unchanged in the model.
+    """
+
+    value: float
+    fixed: bool
+    lb: Union[None, float]
+    ub: Union[None, float]
+    num_samples: int
+    is_sweep: bool
+
+
+#: Validators for the 'exports' of serialized :class:`FlowsheetExport` data:
+#: the shape of the whole mapping, and the values of one export.
+#: Built once, since building the schema is the expensive part.
+_exports_adapter = TypeAdapter(Dict[str, dict])
+_export_values_adapter = TypeAdapter(ExportValues)
+
 
 class ModelOption(BaseModel):
     """An option for building/running the model."""
@@ -204,6 +256,8 @@ class ModelOption(BaseModel):
     min_val: Union[None, int, float] = None
     max_val: Union[None, int, float] = None
     value: Any = None
+    # write NaN/Infinity in JSON, like the json module, instead of null
+    model_config = ConfigDict(ser_json_inf_nan="constants")
 
     @field_validator("display_name")
     @classmethod
@@ -279,6 +333,8 @@ class FlowsheetExport(BaseModel):
     dof: int = 0
     sweep_results: Union[None, dict] = {}
     build_options: Dict[str, ModelOption] = {}
+    # write NaN/Infinity in JSON, like the json module, instead of null
+    model_config = ConfigDict(ser_json_inf_nan="constants")
 
     # set name dynamically from object
     @field_validator("name")
@@ -432,12 +488,17 @@ class FlowsheetExport(BaseModel):
                 raise ValueError(
                     f"Bad CSV header: '{req}' column is required. data=" f"{header}"
                 )
+        # boolean values are in the columns starting with 'is_'
+        bool_columns = [k for k in header if k.startswith("is_")]
+        # the same units expressions usually repeat on many rows,
+        # so each distinct one is evaluated only once
+        units_cache = {}
         num = 0
         for row in rows:
             if len(row) == 0:
                 continue
             # build raw dict from values and header
-            data = {k: v for k, v in zip(header, row)}
+            data = dict(zip(header, row))
             # evaluate the object in the flowsheet
             try:
                 data["obj"] = eval(data["obj"], {"fs": flowsheet})
@@ -447,26 +508,30 @@ class FlowsheetExport(BaseModel):
             norm_units = data["ui_units"].strip()
             if norm_units in ("", "none", "-"):
                 data["ui_units"] = pyo.units.dimensionless
+            elif norm_units in units_cache:
+                data["ui_units"] = units_cache[norm_units]
             else:
                 try:
                     data["ui_units"] = eval(norm_units, {"units": pyo.units})
                 except Exception as err:
                     raise ValueError(f"Bad units '{norm_units}': {err}")
-            # process boolean values (starting with 'is_')
-            for k in data:
-                if k.startswith("is_"):
-                    v = data[k].lower()
-                    if v == "true":
-                        data[k] = True
-                    elif v == "false":
-                        data[k] = False
-                    else:
-                        raise ValueError(
-                            f"Bad value '{data[k]}' "
-                            f"for boolean argument '{k}': "
-                            f"must be 'true' or 'false' "
-                            f"(case-insensitive)"
-                        )
+                units_cache[norm_units] = data["ui_units"]
+            # process boolean values
+            for k in bool_columns:
+                if k not in data:  # short row
+                    continue
+                v = data[k].lower()
+                if v == "true":
+                    data[k] = True
+                elif v == "false":
+                    data[k] = False
+                else:
+                    raise ValueError(
+                        f"Bad value '{data[k]}' "
+                        f"for boolean argument '{k}': "
+                        f"must be 'true' or 'false' "
+                        f"(case-insensitive)"
+                    )
             # add parsed export
             self.add(data=data)
             num += 1
@@ -485,15 +550,10 @@ class FlowsheetExport(BaseModel):
         Raises:
             IOError: If path is given, and not writable
         """
-        # open file for writing
-        if isinstance(output, TextIOBase):
-            output_file = output
-        else:
-            p = Path(output)
-            output_file = p.open("w")
-
-        # initialize
-        csv_output_file = writer(output_file)
+        # initialize: rows are written to an in-memory buffer, so that the
+        # output gets a single write instead of one per row
+        buf = StringIO()
+        csv_output_file = writer(buf)
 
         # write header row
         obj = next(iter(self.exports.values()))
@@ -522,6 +582,14 @@ class FlowsheetExport(BaseModel):
             csv_output_file.writerow(values)
             num += 1
 
+        # write buffered text to output
+        if isinstance(output, TextIOBase):
+            output.write(buf.getvalue())
+        else:
+            # write encoded bytes, bypassing the text layer
+            # (this also keeps the line endings written by the csv module)
+            Path(output).write_bytes(buf.getvalue().encode("utf-8"))
+
         return num
 
     @staticmethod
@@ -734,84 +802,104 @@ class FlowsheetInterface:
         """
         return self.fs_exp.model_dump(exclude={"obj"})
 
-    def load(self, data: Dict):
+    def json(self) -> str:
+        """Serialize to JSON.
+
+        The JSON is written directly by pydantic's serializer, which is much faster
+        than passing the output of :meth:`dict` to the standard library ``json`` module.
+
+        Returns:
+            Serialized contained FlowsheetExport object, as a JSON string
+        """
+        return self.fs_exp.model_dump_json(exclude={"obj"})
+
+    def load(self, data: Dict, trusted: bool = False):
         """Load values from the data into corresponding variables in this
         instance's FlowsheetObject.
 
         Args:
             data: The input flowsheet (probably deserialized from JSON)
+            trusted: If True, the data was produced by :meth:`dict` (e.g., it was
+                saved and read back unmodified) and is used without validation.
+                Leave as False for data that may have been edited.
         """
         u = pyo.units
-        fs = FlowsheetExport.model_validate(data)  # new instance from data
-        # Set the value for each input variable
-        missing = []
+        exports = data.get("exports", {})
+        if not trusted:
+            # check the shape here; values are validated below, if used
+            exports = _exports_adapter.validate_python(exports)
+        # Validate the values of all editable inputs before changing anything,
+        # so that bad data leaves the model as it was. Outputs and read-only
+        # inputs are not copied, so they are not validated.
         # 'src' is the data source and 'dst' is this flowsheet (destination)
-        for key, src in fs.exports.items():
+        missing = []
+        updates = []
+        for key, src in exports.items():
             # get corresponding exported variable
             try:
                 dst = self.fs_exp.exports[key]
             except KeyError:
-                missing.append((key, src.name))
+                missing.append((key, src.get("name", "")))
                 continue
-            # set value in this flowsheet
-            ui_units = dst.ui_units
             if dst.is_input and not dst.is_readonly:
-                # only update if value has changed
-                if dst.value != src.value:
-                    # print(f'changing value for {key} from {dst.value} to {src.value}')
-                    # create a Var so Pyomo can do the unit conversion for us
-                    tmp = pyo.Var(initialize=src.value, units=ui_units)
-                    tmp.construct()
-                    # Convert units when setting value in the model
-                    new_val = pyo.value(u.convert(tmp, to_units=u.get_units(dst.obj)))
-                    # print(f'changing value for {key} from {dst.value} to {new_val}')
-                    dst.obj.set_value(new_val)
-                    # Don't convert units when setting the exported value
-                    dst.value = src.value
-
-                # update other variable properties if changed, not applicable for parameters
-                if dst.obj.is_variable_type():
-                    if dst.obj.fixed != src.fixed:
-                        # print(f'changing fixed for {key} from {dst.obj.fixed} to {src.fixed}')
-                        if src.fixed:
-                            dst.obj.fix()
-                        else:
-                            dst.obj.unfix()
-                        dst.fixed = src.fixed
-                    # update bounds
-                    if dst.lb != src.lb:
-                        # print(f'changing lb for {key} from {dst.lb} to {src.lb}')
-                        if src.lb is None or src.lb == "":
-                            dst.obj.setlb(None)
-                            dst.lb = None
-                        else:
-                            tmp = pyo.Var(initialize=src.lb, units=ui_units)
-                            tmp.construct()
-                            new_lb = pyo.value(
-                                u.convert(tmp, to_units=u.get_units(dst.obj))
-                            )
-                            dst.obj.setlb(new_lb)
-                            dst.lb = src.lb
-                    if dst.ub != src.ub:
-                        # print(f'changing ub for {key} from {dst.ub} to {src.ub}')
-                        if src.ub is None or src.ub == "":
-                            dst.obj.setub(None)
-                            dst.ub = None
-                        else:
-                            tmp = pyo.Var(initialize=src.ub, units=ui_units)
-                            tmp.construct()
-                            new_ub = pyo.value(
-                                u.convert(tmp, to_units=u.get_units(dst.obj))
-                            )
-                            # print(f'changing ub for {key} from {dst.obj.ub} to {new_ub}')
-                            dst.obj.setub(new_ub)
-                            dst.ub = src.ub
-
-                if dst.is_sweep != src.is_sweep:
-                    dst.is_sweep = src.is_sweep
-
-                if dst.num_samples != src.num_samples:
-                    dst.num_samples = src.num_samples
+                if not trusted:
+                    src = _export_values_adapter.validate_python(src)
+                updates.append((key, dst, src))
+        # Set the value for each input variable
+        for key, dst, src in updates:
+            ui_units = dst.ui_units
+            # only update fields that are given, and have changed
+            if "value" in src and dst.value != src["value"]:
+                # print(f'changing value for {key} from {dst.value} to {src["value"]}')
+                # create a Var so Pyomo can do the unit conversion for us
+                tmp = pyo.Var(initialize=src["value"], units=ui_units)
+                tmp.construct()
+                # Convert units when setting value in the model
+                new_val = pyo.value(u.convert(tmp, to_units=dst.obj_units))
+                # print(f'changing value for {key} from {dst.value} to {new_val}')
+                dst.obj.set_value(new_val)
+                # Don't convert units when setting the exported value
+                dst.value = src["value"]
+
+            # update other variable properties if changed, not applicable for parameters
+            if dst.obj.is_variable_type():
+                if "fixed" in src and dst.obj.fixed != src["fixed"]:
+                    # print(f'changing fixed for {key} from {dst.obj.fixed} to {src["fixed"]}')
+                    if src["fixed"]:
+                        dst.obj.fix()
+                    else:
+                        dst.obj.unfix()
+                    dst.fixed = src["fixed"]
+                # update bounds
+                if "lb" in src and dst.lb != src["lb"]:
+                    # print(f'changing lb for {key} from {dst.lb} to {src["lb"]}')
+                    if src["lb"] is None or src["lb"] == "":
+                        dst.obj.setlb(None)
+                        dst.lb = None
+                    else:
+                        tmp = pyo.Var(initialize=src["lb"], units=ui_units)
+                        tmp.construct()
+                        new_lb = pyo.value(u.convert(tmp, to_units=dst.obj_units))
+                        dst.obj.setlb(new_lb)
+                        dst.lb = src["lb"]
+                if "ub" in src and dst.ub != src["ub"]:
+                    # print(f'changing ub for {key} from {dst.ub} to {src["ub"]}')
+                    if src["ub"] is None or src["ub"] == "":
+                        dst.obj.setub(None)
+                        dst.ub = None
+                    else:
+                        tmp = pyo.Var(initialize=src["ub"], units=ui_units)
+                        tmp.construct()
+                        new_ub = pyo.value(u.convert(tmp, to_units=dst.obj_units))
+                        # print(f'changing ub for {key} from {dst.obj.ub} to {new_ub}')
+                        dst.obj.setub(new_ub)
+                        dst.ub = src["ub"]
+
+            if "is_sweep" in src and dst.is_sweep != src["is_sweep"]:
+                dst.is_sweep = src["is_sweep"]
+
+            if "num_samples" in src and dst.num_samples != src["num_samples"]:
+                dst.num_samples = src["num_samples"]
 
         # update degrees of freedom (dof)
         self.fs_exp.dof = degrees_of_freedom(self.fs_exp.obj)
@@ -945,13 +1033,13 @@ class FlowsheetInterface:
                 if mo.obj.ub is None:
                     mo.ub = mo.obj.ub
                 else:
-                    tmp = pyo.Var(initialize=mo.obj.ub, units=u.get_units(mo.obj))
+                    tmp = pyo.Var(initialize=mo.obj.ub, units=mo.obj_units)
                     tmp.construct()
                     mo.ub = pyo.value(u.convert(tmp, to_units=mo.ui_units))
                 if mo.obj.lb is None:
                     mo.lb = mo.obj.lb
                 else:
-                    tmp = pyo.Var(initialize=mo.obj.lb, units=u.get_units(mo.obj))
+                    tmp = pyo.Var(initialize=mo.obj.lb, units=mo.obj_units)
                     tmp.construct()
                     mo.lb = pyo.value(u.convert(tmp, to_units=mo.ui_units))
                 mo.fixed = mo.obj.fixed
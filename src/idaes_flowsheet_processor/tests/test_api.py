@@ -12,6 +12,7 @@
 """
 Tests for fsapi module
 """
+import json
 import logging
 from pathlib import Path
 import pytest
@@ -268,7 +269,7 @@ def test_load():
     fsi = flowsheet_interface()
     fsi.build(erd_type="pressure_exchanger")
     # get some info
-    var_key = list(fsi.fs_exp.exports.keys())[0]
+    var_key = next(iter(fsi.fs_exp.exports))
     var_obj = fsi.fs_exp.exports[var_key].obj
     save_value = var_obj.value
     # serialize
@@ -296,6 +297,64 @@ def test_load():
         assert False, "Expected a MissingObjectError"
 
 
+@pytest.mark.unit
+def test_load_partial_exports():
+    fsi = flowsheet_interface()
+    fsi.build(erd_type="pressure_exchanger")
+    var_key = next(iter(fsi.fs_exp.exports))
+    var_exp = fsi.fs_exp.exports[var_key]
+    fixed, lb, ub = var_exp.obj.fixed, var_exp.obj.lb, var_exp.obj.ub
+    # only the value is given, other fields are left unchanged
+    fsi.load({"exports": {var_key: {"value": -1000}}})
+    assert var_exp.value == -1000
+    assert (var_exp.obj.fixed, var_exp.obj.lb, var_exp.obj.ub) == (fixed, lb, ub)
+    # values are still validated
+    with pytest.raises(ValueError):
+        fsi.load({"exports": {var_key: {"value": "not a number"}}})
+    # so is the shape of the exports
+    with pytest.raises(ValueError):
+        fsi.load({"exports": {"foobar": 5}})
+    with pytest.raises(ValueError):
+        fsi.load({"exports": None})
+
+
+@pytest.mark.unit
+def test_load_invalid_unchanged():
+    fsi = flowsheet_interface()
+    fsi.build(erd_type="pressure_exchanger")
+    var_key = next(iter(fsi.fs_exp.exports))
+    var_obj = fsi.fs_exp.exports[var_key].obj
+    # add a second input, after the first one
+    fs = fsi.fs_exp.obj
+    fs.test_var = Var(initialize=1.0)
+    fs.test_var.fix()
+    bad_key = fsi.fs_exp.add(obj=fs.test_var, ui_units=pyunits.dimensionless).obj_key
+    orig_value, orig_fixed, orig_dof = value(var_obj), var_obj.fixed, fsi.fs_exp.dof
+    data = {
+        "exports": {
+            var_key: {"value": orig_value + 1, "fixed": not orig_fixed},
+            bad_key: {"value": "not a number"},
+        }
+    }
+    with pytest.raises(ValueError):
+        fsi.load(data)
+    # nothing was changed, not even the valid first input
+    assert value(var_obj) == orig_value
+    assert var_obj.fixed == orig_fixed
+    assert fsi.fs_exp.dof == orig_dof
+
+
+@pytest.mark.unit
+def test_load_trusted():
+    fsi = flowsheet_interface()
+    fsi.build(erd_type="pressure_exchanger")
+    var_key = next(iter(fsi.fs_exp.exports))
+    data = fsi.dict()
+    data["exports"][var_key]["value"] = -1000
+    fsi.load(data, trusted=True)
+    assert fsi.fs_exp.exports[var_key].value == -1000
+
+
 @pytest.mark.unit
 def test_require_methods():
     fsi = flowsheet_interface()
@@ -323,7 +382,7 @@ def test_export_values():
     d1 = fsi.dict()
 
     # change one value
-    key = list(fsi.fs_exp.exports.keys())[0]
+    key = next(iter(fsi.fs_exp.exports))
     orig_value = value(fsi.fs_exp.exports[key].obj)
     new_value = orig_value + 1
     print(f"@@ orig_value = {orig_value}, new value = {new_value}")
@@ -369,7 +428,7 @@ def test_nonoptimal_termination():
     fsi.build()
 
     # pick a crazy value
-    key = list(fsi.fs_exp.exports.keys())[0]
+    key = next(iter(fsi.fs_exp.exports))
     orig_value = value(fsi.fs_exp.exports[key].obj)
     new_value = orig_value + 1e9
     fsi.fs_exp.exports[key].obj.value = new_value
@@ -382,6 +441,21 @@ def test_nonoptimal_termination():
     print(f"* RuntimeError: {excinfo.value}")
 
 
+@pytest.mark.unit
+def test_json():
+    fsi = flowsheet_interface()
+    fsi.build()
+    # non-finite values are kept, as with json.dumps()
+    var_key = next(iter(fsi.fs_exp.exports))
+    fsi.fs_exp.exports[var_key].ub = float("inf")
+    data = json.loads(fsi.json())
+    assert data == fsi.dict()
+    assert data["exports"][var_key]["ub"] == float("inf")
+    # round-trip
+    fsi.load(data)
+    assert fsi.dict() == data
+
+
 @pytest.mark.unit
 def test_has_version():
     fsi = flowsheet_interface()